@@ -1,16 +1,26 @@
 
+from bisect import insort
+from concurrent.futures import ThreadPoolExecutor
 import csv
 from datetime import date
 from functools import total_ordering
-from io import TextIOWrapper
 from itertools import count, repeat
+from os import environ, getpid
+from pathlib import Path
 import re
-from typing import Iterator, List
+from sys import intern
+from typing import Dict, Iterator, List
 from urllib.request import urlopen
 
 
+_VERSION_STRIP = re.compile(r'[^0-9.].*')
+
+
 @total_ordering
 class ReleaseInfo:
+    __slots__ = ('distrib', 'name', 'id', '_order', 'codename', 'cpe', 'suite',
+                 'release_date', 'eol_date', '_uid', '_hash')
+
     def __init__(self, distrib, name: str, id: str, order: int, codename: str = None,
                  cpe: str = None, suite: str = None, release_date: date = date.max,
                  eol_date: date = date.max):
@@ -18,14 +28,17 @@ class ReleaseInfo:
         self.name = name
         self.id = id
         self._order = order
-        self.codename = codename
-        self.cpe = cpe
-        self.suite = suite
+        # these few values are shared by many releases and compared often
+        self.codename = None if codename is None else intern(codename)
+        self.cpe = None if cpe is None else intern(cpe)
+        self.suite = None if suite is None else intern(suite)
         self.release_date = release_date
         self.eol_date = eol_date
+        self._uid = distrib.uid()+'-'+id+('' if codename is None else '-'+codename)
+        self._hash = hash(self._uid)
 
     def uid(self):
-        return self.distrib.uid()+'-'+self.id+('' if self.codename is None else '-'+self.codename)
+        return self._uid
 
     def released(self):
         return self.release_date <= date.today()
@@ -37,223 +50,310 @@ class ReleaseInfo:
         return self.released() and not self.eoled()
 
     def __lt__(self, other):
-        if other.distrib != self.distrib:
+        if other.distrib is not self.distrib:
             return NotImplemented
         return self._order < other._order
 
     def __eq__(self, other):
-        if other.distrib != self.distrib:
+        if other.distrib is not self.distrib:
             return NotImplemented
         return self._order == other._order
 
     def __hash__(self):
-        return hash(self.uid())
+        return self._hash
 
     def __str__(self):
         return str(self.distrib)+" "+self.name
 
 
 class DistInfo:
-    def __init__(self, name: str, id: str, id_like=list()):
+    __slots__ = ('name', 'id', 'id_like', '_releases', '_by_id', '_by_codename',
+                 '_uid', '_hash')
+
+    def __init__(self, name: str, id: str, id_like=()):
         self.name = name
         self.id = id
-        self.id_like = list([id]+list(id_like))
-        self._releases = set()
+        self.id_like = frozenset((id, *id_like))
+        self._releases = []
+        self._by_id: Dict[str, List[ReleaseInfo]] = {}
+        self._by_codename: Dict[str, List[ReleaseInfo]] = {}
+        self._uid = id
+        self._hash = hash(self._uid)
 
     def uid(self):
-        return self.id
+        return self._uid
 
     def add_release(self, *args, **kwargs):
-        self._releases.add(ReleaseInfo(self, *args, **kwargs))
+        self._insert(ReleaseInfo(self, *args, **kwargs))
+
+    def add_releases(self, releases):
+        for name, id, order, cpe, suite, release_date, eol_date in releases:
+            self.add_release(name, id, order, cpe=cpe, suite=suite,
+                             release_date=release_date, eol_date=eol_date)
+
+    def _insert(self, release: ReleaseInfo):
+        insort(self._releases, release)
+        insort(self._by_id.setdefault(release.id, []), release)
+        if release.codename is not None:
+            insort(self._by_codename.setdefault(release.codename, []), release)
 
     def releases(self, id: str = None, codename: str = None, cpe: str = None, suite: str = None,
                  release_date: date = None, eol_date: date = None, released: bool = None,
                  supported: bool = None, eoled: bool = None, after: ReleaseInfo = None,
                  before: ReleaseInfo = None) -> List[ReleaseInfo]:
+        # values may come straight from YAML, e.g. `centos: [7, 8]` gives ints
+        id = None if id is None else str(id)
+        codename = None if codename is None else str(codename)
+        cpe = None if cpe is None else str(cpe)
+        suite = None if suite is None else str(suite)
+        # id and codename are fixed at creation, use their index (keyed by the
+        # normalized str values above) to narrow the scan
+        if codename is not None:
+            candidates = self._by_codename.get(codename, [])
+        elif id is not None:
+            candidates = self._by_id.get(id, [])
+        else:
+            candidates = self._releases
+        today = date.today()
+
         def __filter_func(rel: ReleaseInfo):
-            if id is not None and rel.id != str(id):
+            # cheap exact matches first, date arithmetic last
+            if id is not None and rel.id != id:
                 return False
-            if codename is not None and rel.codename != str(codename):
+            if codename is not None and rel.codename != codename:
                 return False
-            if cpe is not None and rel.cpe != str(cpe):
+            if suite is not None and rel.suite != suite:
                 return False
-            if suite is not None and rel.suite != str(suite):
+            if cpe is not None and rel.cpe != cpe:
                 return False
-            if release_date is not None and rel.release_date != date(release_date):
+            if release_date is not None and rel.release_date != release_date:
                 return False
-            if eol_date is not None and rel.eol_date != date(eol_date):
+            if eol_date is not None and rel.eol_date != eol_date:
                 return False
-            if released is not None and rel.released() != bool(released):
+            if after is not None and not rel > after:
                 return False
-            if supported is not None and rel.supported() != bool(supported):
+            if before is not None and not rel < before:
                 return False
-            if eoled is not None and rel.eoled() != bool(eoled):
+            if released is not None and (rel.release_date <= today) != released:
                 return False
-            if after is not None and not rel > after:
+            if supported is not None and (rel.release_date <= today < rel.eol_date) != supported:
                 return False
-            if before is not None and not rel < before:
+            if eoled is not None and (rel.eol_date <= today) != eoled:
                 return False
             return True
-        return sorted(filter(__filter_func, self._releases))
+        return [rel for rel in candidates if __filter_func(rel)]
 
     def __hash__(self):
-        return hash(self.uid())
+        return self._hash
 
     def __str__(self):
         return self.name
 
 
-__distribs = None
+__distribs = {}
 
 
 def distributions(id: str = None, id_like: set = set()) -> Iterator[DistInfo]:
-    def __filter_func(dist: DistInfo):
-        if id is not None and dist.id != id:
-            return False
-        if not set(id_like) <= set(dist.id_like):
-            return False
-        return True
-    return filter(__filter_func, __distribs)
+    # only hit the network when debian or ubuntu may be part of the answer
+    if id is None or id not in __distribs:
+        __init_debubun_distribs()
+    if id is None:
+        candidates = __distribs.values()
+    elif id in __distribs:
+        candidates = [__distribs[id]]
+    else:
+        candidates = []
+    if not id_like:
+        return iter(candidates)
+    query = frozenset(id_like)
+    return (dist for dist in candidates if query <= dist.id_like)
+
+
+def __distro_info_csv(distribution: DistInfo) -> str:
+    # distro-info-data changes at most daily, keep one copy per day on disk
+    cache_home = Path(environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    if not cache_home.is_absolute():
+        # empty or relative values must be ignored per the XDG spec
+        cache_home = Path.home() / '.cache'
+    cache_dir = cache_home / 'pkg_builder'
+    cache_path = cache_dir / (distribution.id+'-'+date.today().isoformat()+'.csv')
+    try:
+        return cache_path.read_text(encoding='utf-8')
+    except OSError:
+        pass
+    with urlopen('https://debian.pages.debian.net/distro-info-data/' +
+                 distribution.id+'.csv') as rel_data:
+        data = rel_data.read().decode('utf-8')
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in cache_dir.glob(distribution.id+'-*.csv'):
+            stale.unlink()
+        temp_path = cache_path.with_name(cache_path.name+'.'+str(getpid()))
+        temp_path.write_text(data, encoding='utf-8')
+        temp_path.replace(cache_path)
+    except OSError:
+        pass
+    return data
 
 
 def __debubun_rel(distribution: DistInfo) -> DistInfo:
-    with urlopen('https://debian.pages.debian.net/distro-info-data/' +
-                 distribution.id+'.csv') as rel_data:
-        csv_data = csv.reader(TextIOWrapper(rel_data), dialect='unix')
-        # skip the title line: version,codename,series,created,release,eol,eol-server
-        next(csv_data)
-        for order, rel in enumerate(csv_data):
-            release = ReleaseInfo(distribution,
-                                  rel[1] if rel[0] == '' else rel[0] +
-                                  ' ('+rel[1]+')',
-                                  re.sub(r'[^0-9.].*', '', rel[0]),
-                                  order,
-                                  rel[2])
-            if len(rel) > 4:
-                release.release_date = date.fromisoformat(rel[4].strip())
-            if len(rel) > 5:
-                release.eol_date = date.fromisoformat(rel[5].strip())
-            distribution._releases.add(release)
+    data = __distro_info_csv(distribution)
+    csv_data = csv.reader(data.splitlines(), dialect='unix')
+    # skip the title line: version,codename,series,created,release,eol,eol-server
+    next(csv_data)
+    for order, rel in enumerate(csv_data):
+        version = rel[0]
+        if version != '' and not version.replace('.', '').isdigit():
+            # strip trailing qualifiers like ' LTS'
+            version = _VERSION_STRIP.sub('', version)
+        release = ReleaseInfo(distribution,
+                              rel[1] if rel[0] == '' else rel[0] +
+                              ' ('+rel[1]+')',
+                              version,
+                              order,
+                              rel[2])
+        if len(rel) > 4:
+            release.release_date = date.fromisoformat(rel[4].strip())
+        if len(rel) > 5:
+            release.eol_date = date.fromisoformat(rel[5].strip())
+        distribution._insert(release)
     return distribution
 
 
-def __init_distribs():
-    global __distribs
-    if __distribs is not None:
+# (name, id, order, cpe, suite, release_date, eol_date)
+_CENTOS_RELEASES = (
+    ("8", '8', 8, 'cpe:/o:centos:centos:8', None,
+     date(2019,  9, 24), date(2021, 12, 31)),
+    ("7", '7', 7, 'cpe:/o:centos:centos:7', None,
+     date(2014,  7,  7), date(2024,  6, 30)),
+    ("6", '6', 6, 'cpe:/o:centos:centos:6', None,
+     date(2011,  7, 10), date(2020, 11, 30)),
+)
+
+# from https://docs.fedoraproject.org/en-US/releases/eol/
+# and https://pagure.io/fedora-pgm/schedule/tree/main
+# -> "Current Final Target date" / "Fedora Linux ${version} end of life"
+# and https://en.wikipedia.org/wiki/Fedora_Linux_release_history
+_FEDORA_RELEASES = (
+    # ("43", '43', 43, None, 'rawhide',
+    #  date(2025, 11, 17), date(2026, 12,  8)),
+    ("42", '42', 42, None, 'rawhide',
+     date(2025,  4, 15), date(2026,  5, 20)),
+    ("41", '41', 41, 'cpe:/o:fedoraproject:fedora:41', None,
+     date(2024, 10, 22), date(2025, 11, 26)),
+    ("40", '40', 40, 'cpe:/o:fedoraproject:fedora:40', None,
+     date(2024,  4, 23), date(2025,  5, 13)),
+    ("39", '39', 39, 'cpe:/o:fedoraproject:fedora:39', None,
+     date(2023, 11,  7), date(2024, 11, 12)),
+    ("38", '38', 38, 'cpe:/o:fedoraproject:fedora:38', None,
+     date(2023,  4, 18), date(2024,  5, 21)),
+    ("37", '37', 37, 'cpe:/o:fedoraproject:fedora:37', None,
+     date(2022, 11, 15), date(2023, 12,  5)),
+    ("36", '36', 36, 'cpe:/o:fedoraproject:fedora:36', None,
+     date(2022,  5, 10), date(2023,  5, 16)),
+    ("35", '35', 35, 'cpe:/o:fedoraproject:fedora:35', None,
+     date(2021, 11,  2), date(2022, 12, 13)),
+    ("34", '34', 34, 'cpe:/o:fedoraproject:fedora:34', None,
+     date(2021,  4, 27), date(2022,  6,  7)),
+    ("33", '33', 33, 'cpe:/o:fedoraproject:fedora:33', None,
+     date(2020, 10, 27), date(2021, 11, 30)),
+    ("32", '32', 32, 'cpe:/o:fedoraproject:fedora:32', None,
+     date(2020,  4, 28), date(2021,  5, 25)),
+    ("31", '31', 31, 'cpe:/o:fedoraproject:fedora:31', None,
+     date(2019, 10, 29), date(2020, 11, 24)),
+    ("30", '30', 30, 'cpe:/o:fedoraproject:fedora:30', None,
+     date(2019,  5,  7), date(2020,  5, 26)),
+)
+
+
+def __init_debubun_distribs():
+    if 'debian' in __distribs:
         return
-    __distribs = set()
 
-    debian = __debubun_rel(DistInfo("Debian GNU/Linux", 'debian'))
+    # both distro-info-data fetches are independent, run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        debian = pool.submit(__debubun_rel, DistInfo("Debian GNU/Linux", 'debian'))
+        ubuntu = pool.submit(__debubun_rel, DistInfo("Ubuntu", 'ubuntu', id_like=['debian']))
+        debian = debian.result()
+        ubuntu = ubuntu.result()
+
     for release, suite in zip(
             reversed(debian.releases(supported=True)),
-            map(lambda n: 'old'*n+'stable', count(0))):
+            map(lambda n: intern('old'*n+'stable'), count(0))):
         release.suite = suite
     debian.releases(released=False)[0].suite = 'testing'
     debian.releases(codename='sid')[0].suite = 'unstable'
     debian.releases(codename='experimental')[0].suite = 'rc-buggy'
-    __distribs.add(debian)
+    __distribs[debian.id] = debian
 
-    ubuntu = __debubun_rel(DistInfo("Ubuntu", 'ubuntu', id_like=['debian']))
     devel = ubuntu.releases(released=False)
     if len(devel):
         devel[0].suite = 'devel'
-    __distribs.add(ubuntu)
+    __distribs[ubuntu.id] = ubuntu
+
 
+def __init_static_distribs():
     centos = DistInfo("CentOS Linux", 'centos', id_like=['rhel', 'fedora'])
-    centos.add_release("8", '8', 8, cpe='cpe:/o:centos:centos:8',
-                       release_date=date(2019,  9, 24), eol_date=date(2021, 12, 31))
-    centos.add_release("7", '7', 7, cpe='cpe:/o:centos:centos:7',
-                       release_date=date(2014,  7,  7), eol_date=date(2024,  6, 30))
-    centos.add_release("6", '6', 6, cpe='cpe:/o:centos:centos:6',
-                       release_date=date(2011,  7, 10), eol_date=date(2020, 11, 30))
-    __distribs.add(centos)
+    centos.add_releases(_CENTOS_RELEASES)
+    __distribs[centos.id] = centos
 
     fedora = DistInfo("Fedora", 'fedora')
-    # from https://docs.fedoraproject.org/en-US/releases/eol/
-    # and https://pagure.io/fedora-pgm/schedule/tree/main
-    # -> "Current Final Target date" / "Fedora Linux ${version} end of life"
-    # and https://en.wikipedia.org/wiki/Fedora_Linux_release_history
-    # fedora.add_release("43", '43', 43, suite='rawhide',
-    #                    release_date=date(2025, 11, 17), eol_date=date(2026, 12,  8))
-    fedora.add_release("42", '42', 42, suite='rawhide',
-                       release_date=date(2025,  4, 15), eol_date=date(2026,  5, 20))
-    fedora.add_release("41", '41', 41, cpe='cpe:/o:fedoraproject:fedora:41',
-                       release_date=date(2024, 10, 22), eol_date=date(2025, 11, 26))
-    fedora.add_release("40", '40', 40, cpe='cpe:/o:fedoraproject:fedora:40',
-                       release_date=date(2024,  4, 23), eol_date=date(2025,  5, 13))
-    fedora.add_release("39", '39', 39, cpe='cpe:/o:fedoraproject:fedora:39',
-                       release_date=date(2023, 11,  7), eol_date=date(2024, 11, 12))
-    fedora.add_release("38", '38', 38, cpe='cpe:/o:fedoraproject:fedora:38',
-                       release_date=date(2023,  4, 18), eol_date=date(2024,  5, 21))
-    fedora.add_release("37", '37', 37, cpe='cpe:/o:fedoraproject:fedora:37',
-                       release_date=date(2022, 11, 15), eol_date=date(2023, 12,  5))
-    fedora.add_release("36", '36', 36, cpe='cpe:/o:fedoraproject:fedora:36',
-                       release_date=date(2022,  5, 10), eol_date=date(2023,  5, 16))
-    fedora.add_release("35", '35', 35, cpe='cpe:/o:fedoraproject:fedora:35',
-                       release_date=date(2021, 11,  2), eol_date=date(2022, 12, 13))
-    fedora.add_release("34", '34', 34, cpe='cpe:/o:fedoraproject:fedora:34',
-                       release_date=date(2021,  4, 27), eol_date=date(2022,  6,  7))
-    fedora.add_release("33", '33', 33, cpe='cpe:/o:fedoraproject:fedora:33',
-                       release_date=date(2020, 10, 27), eol_date=date(2021, 11, 30))
-    fedora.add_release("32", '32', 32, cpe='cpe:/o:fedoraproject:fedora:32',
-                       release_date=date(2020,  4, 28), eol_date=date(2021,  5, 25))
-    fedora.add_release("31", '31', 31, cpe='cpe:/o:fedoraproject:fedora:31',
-                       release_date=date(2019, 10, 29), eol_date=date(2020, 11, 24))
-    fedora.add_release("30", '30', 30, cpe='cpe:/o:fedoraproject:fedora:30',
-                       release_date=date(2019,  5,  7), eol_date=date(2020,  5, 26))
-    __distribs.add(fedora)
+    fedora.add_releases(_FEDORA_RELEASES)
+    __distribs[fedora.id] = fedora
 
     # redhat = DistInfo("Red Hat Enterprise Linux", 'rhel', id_like=['fedora'])
     # # from https://access.redhat.com/articles/3078
-    # redhat.add_release("9.3 (Ootpa)", '9.3', 903, cpe='cpe:/o:redhat:enterprise_linux:9.3',
-    #                    release_date=date(2023, 11,  7), eol_date=date(2024,  5,  7))
-    # redhat.add_release("9.2 (Ootpa)", '9.2', 902, cpe='cpe:/o:redhat:enterprise_linux:9.2',
-    #                    release_date=date(2023,  5, 10), eol_date=date(2025,  5, 10))
-    # redhat.add_release("9.1 (Ootpa)", '9.1', 901, cpe='cpe:/o:redhat:enterprise_linux:9.1',
-    #                    release_date=date(2022, 11, 15), eol_date=date(2023,  5, 10))
-    # redhat.add_release("9.0 (Ootpa)", '9.0', 900, cpe='cpe:/o:redhat:enterprise_linux:9.0',
-    #                    release_date=date(2022,  5, 17), eol_date=date(2024,  5, 17))
-    # redhat.add_release("8.9 (Ootpa)", '8.9', 809, cpe='cpe:/o:redhat:enterprise_linux:8.9',
-    #                    release_date=date(2023, 11, 14), eol_date=date(2024,  5,  14))
-    # redhat.add_release("8.8 (Ootpa)", '8.8', 808, cpe='cpe:/o:redhat:enterprise_linux:8.8',
-    #                    release_date=date(2023,  5, 16), eol_date=date(2025,  5, 16))
-    # redhat.add_release("8.7 (Ootpa)", '8.7', 807, cpe='cpe:/o:redhat:enterprise_linux:8.7',
-    #                    release_date=date(2022, 11,  9), eol_date=date(2023,  5, 16))
-    # redhat.add_release("8.6 (Ootpa)", '8.6', 806, cpe='cpe:/o:redhat:enterprise_linux:8.6',
-    #                    release_date=date(2022,  5, 10), eol_date=date(2024,  5, 10))
-    # redhat.add_release("8.5 (Ootpa)", '8.5', 805, cpe='cpe:/o:redhat:enterprise_linux:8.5',
-    #                    release_date=date(2021, 11,  9), eol_date=date(2022,  5, 10))
-    # redhat.add_release("8.4 (Ootpa)", '8.4', 804, cpe='cpe:/o:redhat:enterprise_linux:8.4',
-    #                    release_date=date(2021,  5, 18), eol_date=date(2023,  5, 18))
-    # redhat.add_release("8.3 (Ootpa)", '8.3', 803, cpe='cpe:/o:redhat:enterprise_linux:8.3',
-    #                    release_date=date(2020, 11,  3), eol_date=date(2021,  5,  18))
-    # redhat.add_release("8.2 (Ootpa)", '8.2', 802, cpe='cpe:/o:redhat:enterprise_linux:8.2',
-    #                    release_date=date(2020,  4, 28), eol_date=date(2022,  4, 28))
-    # redhat.add_release("8.1 (Ootpa)", '8.1', 801, cpe='cpe:/o:redhat:enterprise_linux:8.1',
-    #                    release_date=date(2019, 11,  5), eol_date=date(2021, 11,  5))
-    # redhat.add_release("8.0 (Ootpa)", '8.0', 800, cpe='cpe:/o:redhat:enterprise_linux:8.0',
-    #                    release_date=date(2019,  5,  7), eol_date=date(2019, 11,  5))
-    # redhat.add_release("7.9 (Maipo)", '7.9', 709, cpe='cpe:/o:redhat:enterprise_linux:7.9',
-    #                    release_date=date(2020,  9, 29), eol_date=date(2024,  6, 30))
-    # redhat.add_release("7.8 (Maipo)", '7.8', 708, cpe='cpe:/o:redhat:enterprise_linux:7.8',
-    #                    release_date=date(2020,  3, 31), eol_date=date(2020,  9, 29))
-    # redhat.add_release("7.7 (Maipo)", '7.7', 707, cpe='cpe:/o:redhat:enterprise_linux:7.7',
-    #                    release_date=date(2019,  8,  6), eol_date=date(2021,  8, 30))
-    # redhat.add_release("7.6 (Maipo)", '7.6', 706, cpe='cpe:/o:redhat:enterprise_linux:7.6',
-    #                    release_date=date(2018, 10, 30), eol_date=date(2021,  5, 31))
-    # redhat.add_release("7.5 (Maipo)", '7.5', 705, cpe='cpe:/o:redhat:enterprise_linux:7.5',
-    #                    release_date=date(2018,  4, 10), eol_date=date(2020,  4, 30))
-    # redhat.add_release("7.4 (Maipo)", '7.4', 704, cpe='cpe:/o:redhat:enterprise_linux:7.4',
-    #                    release_date=date(2017,  7, 31), eol_date=date(2019,  8, 31))
-    # redhat.add_release("7.3 (Maipo)", '7.3', 703, cpe='cpe:/o:redhat:enterprise_linux:7.3',
-    #                    release_date=date(2016, 11,  3), eol_date=date(2018, 11, 30))
-    # redhat.add_release("7.2 (Maipo)", '7.2', 702, cpe='cpe:/o:redhat:enterprise_linux:7.2',
-    #                    release_date=date(2015, 11, 19), eol_date=date(2017, 11, 30))
-    # redhat.add_release("7.1 (Maipo)", '7.1', 701, cpe='cpe:/o:redhat:enterprise_linux:7.1',
-    #                    release_date=date(2015,  3,  5), eol_date=date(2017,  3, 31))
-    # redhat.add_release("7.0 (Maipo)", '7.0', 700, cpe='cpe:/o:redhat:enterprise_linux:7.0',
-    #                    release_date=date(2014,  6,  9), eol_date=date(2015,  3,  5))
-    # __distribs.add(redhat)
-
-
-__init_distribs()
+    # redhat.add_releases((
+    #     ("9.3 (Ootpa)", '9.3', 903, 'cpe:/o:redhat:enterprise_linux:9.3', None,
+    #      date(2023, 11,  7), date(2024,  5,  7)),
+    #     ("9.2 (Ootpa)", '9.2', 902, 'cpe:/o:redhat:enterprise_linux:9.2', None,
+    #      date(2023,  5, 10), date(2025,  5, 10)),
+    #     ("9.1 (Ootpa)", '9.1', 901, 'cpe:/o:redhat:enterprise_linux:9.1', None,
+    #      date(2022, 11, 15), date(2023,  5, 10)),
+    #     ("9.0 (Ootpa)", '9.0', 900, 'cpe:/o:redhat:enterprise_linux:9.0', None,
+    #      date(2022,  5, 17), date(2024,  5, 17)),
+    #     ("8.9 (Ootpa)", '8.9', 809, 'cpe:/o:redhat:enterprise_linux:8.9', None,
+    #      date(2023, 11, 14), date(2024,  5,  14)),
+    #     ("8.8 (Ootpa)", '8.8', 808, 'cpe:/o:redhat:enterprise_linux:8.8', None,
+    #      date(2023,  5, 16), date(2025,  5, 16)),
+    #     ("8.7 (Ootpa)", '8.7', 807, 'cpe:/o:redhat:enterprise_linux:8.7', None,
+    #      date(2022, 11,  9), date(2023,  5, 16)),
+    #     ("8.6 (Ootpa)", '8.6', 806, 'cpe:/o:redhat:enterprise_linux:8.6', None,
+    #      date(2022,  5, 10), date(2024,  5, 10)),
+    #     ("8.5 (Ootpa)", '8.5', 805, 'cpe:/o:redhat:enterprise_linux:8.5', None,
+    #      date(2021, 11,  9), date(2022,  5, 10)),
+    #     ("8.4 (Ootpa)", '8.4', 804, 'cpe:/o:redhat:enterprise_linux:8.4', None,
+    #      date(2021,  5, 18), date(2023,  5, 18)),
+    #     ("8.3 (Ootpa)", '8.3', 803, 'cpe:/o:redhat:enterprise_linux:8.3', None,
+    #      date(2020, 11,  3), date(2021,  5,  18)),
+    #     ("8.2 (Ootpa)", '8.2', 802, 'cpe:/o:redhat:enterprise_linux:8.2', None,
+    #      date(2020,  4, 28), date(2022,  4, 28)),
+    #     ("8.1 (Ootpa)", '8.1', 801, 'cpe:/o:redhat:enterprise_linux:8.1', None,
+    #      date(2019, 11,  5), date(2021, 11,  5)),
+    #     ("8.0 (Ootpa)", '8.0', 800, 'cpe:/o:redhat:enterprise_linux:8.0', None,
+    #      date(2019,  5,  7), date(2019, 11,  5)),
+    #     ("7.9 (Maipo)", '7.9', 709, 'cpe:/o:redhat:enterprise_linux:7.9', None,
+    #      date(2020,  9, 29), date(2024,  6, 30)),
+    #     ("7.8 (Maipo)", '7.8', 708, 'cpe:/o:redhat:enterprise_linux:7.8', None,
+    #      date(2020,  3, 31), date(2020,  9, 29)),
+    #     ("7.7 (Maipo)", '7.7', 707, 'cpe:/o:redhat:enterprise_linux:7.7', None,
+    #      date(2019,  8,  6), date(2021,  8, 30)),
+    #     ("7.6 (Maipo)", '7.6', 706, 'cpe:/o:redhat:enterprise_linux:7.6', None,
+    #      date(2018, 10, 30), date(2021,  5, 31)),
+    #     ("7.5 (Maipo)", '7.5', 705, 'cpe:/o:redhat:enterprise_linux:7.5', None,
+    #      date(2018,  4, 10), date(2020,  4, 30)),
+    #     ("7.4 (Maipo)", '7.4', 704, 'cpe:/o:redhat:enterprise_linux:7.4', None,
+    #      date(2017,  7, 31), date(2019,  8, 31)),
+    #     ("7.3 (Maipo)", '7.3', 703, 'cpe:/o:redhat:enterprise_linux:7.3', None,
+    #      date(2016, 11,  3), date(2018, 11, 30)),
+    #     ("7.2 (Maipo)", '7.2', 702, 'cpe:/o:redhat:enterprise_linux:7.2', None,
+    #      date(2015, 11, 19), date(2017, 11, 30)),
+    #     ("7.1 (Maipo)", '7.1', 701, 'cpe:/o:redhat:enterprise_linux:7.1', None,
+    #      date(2015,  3,  5), date(2017,  3, 31)),
+    #     ("7.0 (Maipo)", '7.0', 700, 'cpe:/o:redhat:enterprise_linux:7.0', None,
+    #      date(2014,  6,  9), date(2015,  3,  5)),
+    # ))
+    # __distribs[redhat.id] = redhat
+
+
+__init_static_distribs()
@@ -1,54 +1,99 @@
-import atexit
-from hashlib import sha256
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
 from os import link
 from pathlib import Path
-from shutil import copy2, rmtree
+from random import uniform
+from shutil import copy2, copyfileobj
 import socket
-from tempfile import mkdtemp
+from tempfile import TemporaryDirectory
+from threading import Event, Lock
 from time import sleep
-from urllib.error import URLError
+from urllib.error import HTTPError, URLError
 from urllib.request import urlopen
 
 
+class DownloadError(URLError):
+    pass
+
+
 class Downloader:
-    def __init__(self, verbose=False, cancellation_point=lambda: None):
+    def __init__(self, verbose=False, cancellation_point=lambda: None, max_workers=8):
         self._verbose = verbose
         self._downloaded = {}
-        self._download_dir = Path(mkdtemp(prefix='DOWNLOAD_DIR.'))
-        atexit.register(rmtree, self._download_dir)
+        self._lock = Lock()
+        self._tempdir = TemporaryDirectory(prefix='DOWNLOAD_DIR.')
+        self._download_dir = Path(self._tempdir.name)
         self._cancellation_point = cancellation_point
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+
+    def close(self):
+        self._pool.shutdown()
+        self._tempdir.cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def download(self, url, path):
         self._cancellation_point()
-        if url in self._downloaded:
-            while self._downloaded[url] is None:
-                sleep(0.01)
-                self._cancellation_point()
-                if self._verbose:
-                    print("Downloading " + url + " : in cache!")
-        else:
-            self._downloaded[url] = None
-            temp_path = self._download_dir / \
-                sha256(bytes(url, 'UTF8')).hexdigest()
-            if self._verbose:
-                print("Downloading " + url + " ...")
-            for timeout in [1, 2, 3, 5, 7]:
-                try:
-                    with urlopen(url, timeout=timeout) as raw_src, temp_path.open('wb') as raw_dst:
-                        raw_dst.write(raw_src.read())
+        while True:
+            with self._lock:
+                entry = self._downloaded.get(url)
+                if entry is None:
+                    pending = self._downloaded[url] = Event()
                     break
-                except URLError as err:
-                    if timeout == 7:
-                        raise URLError('while downloading ' +
-                                       url + ': ' + str(err))
-                except socket.timeout as err:
-                    if timeout == 7:
-                        raise URLError('while downloading ' +
-                                       url + ': ' + str(err))
+            if not isinstance(entry, Event):
+                pending = None
+                break
             if self._verbose:
-                print("Downloading " + url + " done!")
-            self._downloaded[url] = temp_path
+                print("Downloading " + url + " : in cache!")
+            while not entry.wait(0.1):
+                self._cancellation_point()
+        if pending is not None:
+            try:
+                entry = self._fetch(url)
+            except BaseException:
+                # let the waiters retry the download themselves
+                with self._lock:
+                    del self._downloaded[url]
+                pending.set()
+                raise
+            with self._lock:
+                self._downloaded[url] = entry
+            pending.set()
         try:
-            link(self._downloaded[url], path)
+            link(entry, path)
         except OSError:
-            copy2(self._downloaded[url], path)
+            copy2(entry, path)
+
+    def download_many(self, url_path_pairs):
+        # fetches are I/O bound, overlap them; consuming the results re-raises
+        # the first failure
+        list(self._pool.map(lambda url_path: self.download(*url_path), url_path_pairs))
+
+    def _fetch(self, url):
+        temp_path = self._download_dir / \
+            blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+        if self._verbose:
+            print("Downloading " + url + " ...")
+        timeouts = [1, 2, 3, 5, 7]
+        for attempt, timeout in enumerate(timeouts):
+            try:
+                with urlopen(url, timeout=timeout) as raw_src, temp_path.open('wb') as raw_dst:
+                    copyfileobj(raw_src, raw_dst, 1 << 20)
+                break
+            except (URLError, socket.timeout) as err:
+                # client errors won't go away by retrying, except timeouts and throttling
+                permanent = (isinstance(err, HTTPError) and 400 <= err.code < 500
+                             and err.code not in (408, 429))
+                if permanent or attempt == len(timeouts) - 1:
+                    raise DownloadError('while downloading ' +
+                                        url + ': ' + str(err)) from err
+                # back off with full jitter before retrying
+                sleep(uniform(0, min(2 ** attempt, 30)))
+                self._cancellation_point()
+        if self._verbose:
+            print("Downloading " + url + " done!")
+        return temp_path